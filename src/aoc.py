@@ -0,0 +1,277 @@
+# Advent of Code 2018, Runner
+# (c) blu3r4y
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import namedtuple
+
+SOURCES = os.path.dirname(os.path.abspath(__file__))
+ASSETS = os.path.join(SOURCES, os.pardir, 'assets')
+
+Result = namedtuple("Result", ["day", "part", "answer", "imports", "wall", "cpu", "spans"])
+
+
+def asset(name):
+    return os.path.join(ASSETS, name)
+
+
+def lines(name):
+    with open(asset(name)) as f:
+        return f.readlines()
+
+
+def loadtxt(name, **kwargs):
+    import numpy as np
+    return np.loadtxt(asset(name), dtype=int, **kwargs)
+
+
+def parsed(parser, name, reader=lambda path: open(path).readlines()):
+    # parser(reader(path)), possibly from the parse cache
+    from cache import cached
+    return cached(parser, asset(name), reader)
+
+
+def marbles():
+    players, points = re.findall(r'\d+', open(asset("day9.txt")).read())
+    return int(players), int(points)
+
+
+# the puzzle inputs and solver calls per day, as in the __main__ block of each module
+PUZZLES = {
+    1: [("part1", lambda m: m.part1(m.read(asset("day1.txt")))),
+        ("part2", lambda m: m.part2(m.read(asset("day1.txt"))))],
+    2: [("part1", lambda m: m.part1(lines("day2.txt"))),
+        ("part2", lambda m: m.part2(lines("day2.txt")))],
+    3: [("part1", lambda m: m.part1(parsed(m.parse, "day3.txt"))),
+        ("part2", lambda m: m.part2(parsed(m.parse, "day3.txt")))],
+    4: [("part1", lambda m: m.part1(parsed(m._parse, "day4.txt"))),
+        ("part2", lambda m: m.part2(parsed(m._parse, "day4.txt")))],
+    5: [("part1", lambda m: m.part1(m.read(asset("day5.txt")))),
+        ("part2", lambda m: m.part2(m.read(asset("day5.txt"))))],
+    6: [("part1", lambda m: m.part1(loadtxt("day6.txt", delimiter=','))),
+        ("part2", lambda m: m.part2(loadtxt("day6.txt", delimiter=','), 10000))],
+    7: [("part1", lambda m: m.part1(parsed(m._parse, "day7.txt"))),
+        ("part2", lambda m: m.part2(parsed(m._parse, "day7.txt"), 5, 60))],
+    8: [("part1", lambda m: m.part1(loadtxt("day8.txt"))),
+        ("part2", lambda m: m.part2(loadtxt("day8.txt")))],
+    9: [("part1", lambda m: m.part1(*marbles())),
+        ("part2", lambda m: m.part2(*marbles()))],
+    10: [("solve", lambda m: m.solve(*parsed(m._parse, "day10.txt")))],
+    11: [("part1", lambda m: m.part1(int(open(asset("day11.txt")).read()))),
+         ("part2", lambda m: m.part2(int(open(asset("day11.txt")).read())))],
+    12: [("part1", lambda m: m.part1(*parsed(m.parse, "day12.txt"))),
+         ("part2", lambda m: m.part2(*parsed(m.parse, "day12.txt")))],
+    13: [("part1", lambda m: m.part1(*parsed(m.parse, "day13.txt"))),
+         ("part2", lambda m: m.part2(*parsed(m.parse, "day13.txt")))],
+    14: [("part1", lambda m: m.part1(int(open(asset("day14.txt")).read()))),
+         ("part2", lambda m: m.part2(open(asset("day14.txt")).read().strip()))],
+    15: [("part1", lambda m: m.part1(parsed(m.Maze.from_file, "day15.txt", lambda path: path))),
+         ("part2", lambda m: m.part2(parsed(m.Maze.from_file, "day15.txt", lambda path: path)))],
+    16: [("part1", lambda m: m.part1(parsed(m._parse, "day16.txt")[0])),
+         ("part2", lambda m: m.part2(*parsed(m._parse, "day16.txt")))],
+    17: [("solve", lambda m: m.solve(*parsed(m._parse, "day17.txt")))],
+    18: [("part1", lambda m: m.solve(parsed(m.parse, "day18.txt"), 10)),
+         ("part2", lambda m: m.solve(parsed(m.parse, "day18.txt"), 1000000000))],
+    19: [("part1", lambda m: m.solve(*parsed(m.parse, "day19.txt"))),
+         ("part2", lambda m: m.solve(*parsed(m.parse, "day19.txt"), optimize_for_part2=True))],
+    20: [("part1", lambda m: m.part1(parsed(m.parse, "day20.txt", lambda path: open(path).readlines()[0]))),
+         ("part2", lambda m: m.part2(parsed(m.parse, "day20.txt", lambda path: open(path).readlines()[0])))],
+    21: [("part1", lambda m: m.solve(*parsed(m.parse, "day21.txt"))),
+         ("part2", lambda m: m.solve(*parsed(m.parse, "day21.txt"), return_first_match=False))],
+    22: [("part1", lambda m: m.part1(3066, (13, 726))),
+         ("part2", lambda m: m.part2(3066, (13, 726)))],
+    23: [("part1", lambda m: m.part1(parsed(m._parse, "day23.txt"))),
+         ("part2", lambda m: m.part2(parsed(m._parse, "day23.txt")))],
+    24: [("part1", lambda m: parsed(m.Game.from_string, "day24.txt").play()),
+         ("part2", lambda m: parsed(m.Game.from_string, "day24.txt").optimize())],
+    25: [("part1", lambda m: m.part1(parsed(m.parse, "day25.txt")))],
+}
+
+# parts that dominate the total run time, they are scheduled first so that they run side by side
+SLOW = [(15, "part2"), (9, "part2"), (24, "part2"), (15, "part1"), (21, "part2"), (22, "part2")]
+
+
+def run_part(day, part):
+    solver = dict(PUZZLES[day])[part]
+
+    # importing is measured separately (it is free if the worker imported the module before)
+    import instrument
+
+    imports = time.perf_counter()
+    try:
+        module = importlib.import_module("day{}".format(day))
+    except ImportError as e:
+        # e.g. a missing optional dependency, which only affects this day
+        return Result(day, part, "{}: {}".format(type(e).__name__, e), time.perf_counter() - imports, 0.0, 0.0, {})
+    imports = time.perf_counter() - imports
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        # silence the progress output some solvers print
+        with contextlib.redirect_stdout(io.StringIO()), instrument.span("day{}.{}".format(day, part)):
+            answer = solver(module)
+    except Exception as e:
+        answer = "{}: {}".format(type(e).__name__, e)
+
+    return Result(day, part, str(answer).strip(), imports, time.perf_counter() - wall, time.process_time() - cpu,
+                  instrument.collect())
+
+
+def run(days, jobs=None):
+    tasks = [(day, part) for day in days for part, _ in PUZZLES[day]]
+    tasks = sorted(tasks, key=lambda task: SLOW.index(task) if task in SLOW else len(SLOW))
+
+    if jobs == 1:
+        # run in-process, useful for debugging
+        return [run_part(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_part, *task) for task in tasks]
+        return [future.result() for future in as_completed(futures)]
+
+
+def import_times(day):
+    # import the module in a fresh interpreter, which reports the time per imported module on stderr
+    command = [sys.executable, "-X", "importtime", "-c", "import day{}".format(day)]
+    process = subprocess.run(command, cwd=SOURCES, stderr=subprocess.PIPE, universal_newlines=True)
+    if process.returncode != 0:
+        # the import failed, the module is still listed with the time until it raised
+        return None, []
+    report = process.stderr
+
+    # lines look like "import time: <self us> | <cumulative us> | <indentation by depth><module>"
+    modules = []
+    for line in report.splitlines()[1:]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((depth, name.strip(), int(cumulative) / 1e6))
+
+    # the day itself is at the top, the modules it imports directly are listed right before it
+    index = next((i for i, (depth, name, _) in enumerate(modules) if depth == 0 and name == "day{}".format(day)), None)
+    if index is None:
+        return None, []
+
+    children = []
+    for depth, name, cumulative in reversed(modules[:index]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children.append((name, cumulative))
+
+    return modules[index][2], sorted(children, key=lambda child: -child[1])
+
+
+def parse_days(spec):
+    # comma separated list of days and day ranges, e.g. "1-5,9,15"
+    days = set()
+    for token in spec.split(','):
+        first, _, last = token.partition('-')
+        days.update(range(int(first), int(last or first) + 1))
+
+    unknown = days - set(PUZZLES.keys())
+    if unknown:
+        raise argparse.ArgumentTypeError("unknown days: {}".format(sorted(unknown)))
+
+    return sorted(days)
+
+
+def print_results(results, elapsed):
+    print("{:>3}  {:<6} {:<30} {:>9} {:>9} {:>9}".format("day", "part", "answer", "import", "wall", "cpu"))
+    for r in sorted(results, key=lambda r: (r.day, r.part)):
+        print("{:>3}  {:<6} {:<30} {:>8.3f}s {:>8.3f}s {:>8.3f}s".format(
+            r.day, r.part, r.answer[:30], r.imports, r.wall, r.cpu))
+
+    print()
+    print("total: {:.3f}s wall, {:.3f}s cpu".format(elapsed, sum(r.cpu for r in results)))
+
+
+def main(argv=None):
+    # the generators only need the standard library, the solvers are imported lazily
+    import generate
+
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code 2018 solutions")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run_ = commands.add_parser("run", help="run the solvers on the puzzle inputs")
+    run_.add_argument("--days", type=parse_days, default=sorted(PUZZLES.keys()), help="e.g. 1-25 or 1,3,5-7")
+    run_.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    run_.add_argument("--cache", help="cache parsed inputs in this directory")
+    run_.add_argument("--instrument", help="write the timings of the instrumented functions to this file, "
+                                           "as json if it ends with .json, otherwise as collapsed stacks")
+
+    bench_ = commands.add_parser("bench", help="benchmark the solvers on inputs of increasing size")
+    bench_.add_argument("--days", type=parse_days, default=sorted(PUZZLES.keys()), help="e.g. 1-25 or 1,3,5-7")
+    bench_.add_argument("--repeat", type=int, default=5, help="timed runs per input size")
+    bench_.add_argument("--max-sizes", type=int, default=None, help="only run the first n input sizes")
+    bench_.add_argument("--output", help="write the results to this json file")
+    bench_.add_argument("--baseline", help="compare the results against this json file")
+    bench_.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, relative to the baseline")
+
+    imports_ = commands.add_parser("imports", help="report the import time of the modules, like -X importtime")
+    imports_.add_argument("--days", type=parse_days, default=sorted(PUZZLES.keys()), help="e.g. 1-25 or 1,3,5-7")
+    imports_.add_argument("--top", type=int, default=3, help="number of slowest imported modules to list")
+
+    generate_ = commands.add_parser("generate", help="print a synthetic puzzle input")
+    generate_.add_argument("day", type=int, choices=sorted(generate.GENERATORS), help="day of the puzzle format")
+    generate_.add_argument("size", type=int, help="size of the input, e.g. number of lines")
+    generate_.add_argument("--seed", type=int, default=0, help="random seed")
+
+    args = parser.parse_args(argv)
+
+    # solvers must not block on interactive plots
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    if args.command == "run":
+        if args.cache:
+            # the workers inherit the environment
+            os.environ["AOC_CACHE"] = os.path.abspath(args.cache)
+        if args.instrument:
+            os.environ["AOC_INSTRUMENT"] = "1"
+
+        start = time.perf_counter()
+        results = run(args.days, args.jobs)
+        print_results(results, time.perf_counter() - start)
+
+        if args.instrument:
+            import instrument
+            spans = instrument.merge(r.spans for r in results)
+            with open(args.instrument, 'w') as f:
+                if args.instrument.endswith(".json"):
+                    json.dump(spans, f, indent=2, sort_keys=True)
+                else:
+                    f.write('\n'.join(instrument.collapsed(spans)) + '\n')
+
+    elif args.command == "bench":
+        import bench
+        return bench.main(args)
+
+    elif args.command == "imports":
+        print("{:>3} {:>10}  {}".format("day", "import", "slowest imports"))
+        for day in args.days:
+            total, children = import_times(day)
+            if total is None:
+                print("{:>3} {:>10}".format(day, "failed"))
+                continue
+
+            slowest = ", ".join("{} {:.1f}ms".format(name, t * 1e3) for name, t in children[:args.top])
+            print("{:>3} {:>8.1f}ms  {}".format(day, total * 1e3, slowest))
+
+    elif args.command == "generate":
+        result = generate.GENERATORS[args.day](args.size, seed=args.seed)
+        print(result if isinstance(result, str) else ''.join(result), end='')
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+# Advent of Code 2018, Benchmarks
+# (c) blu3r4y
+
+import importlib
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+
+import generate
+from aoc import PUZZLES, lines
+
+# every benchmark runs the solver on inputs of increasing size, setup(size) builds the input (not timed)
+Benchmark = namedtuple("Benchmark", ["name", "sizes", "setup", "run"])
+
+
+def day(n):
+    return importlib.import_module("day{}".format(n))
+
+
+def puzzle(n, part):
+    # benchmark on the real puzzle input only (parsing included)
+    solver = dict(PUZZLES[n])[part]
+    return Benchmark("day{}.{}".format(n, part), [1], lambda size: (day(n),), solver)
+
+
+def array(lines, delimiter=None):
+    import numpy as np
+    return np.array([list(map(int, line.split(delimiter))) for line in lines])
+
+
+def networkx_order(steps):
+    # the lexicographical topological sort of day 7 with networkx, to compare against day7.part1
+    import networkx as nx
+    return ''.join(nx.lexicographical_topological_sort(nx.DiGraph(steps)))
+
+
+def elfcode_machine(name, compiled=False):
+    # the part 2 program of day 19 runs practically forever, which is good for measuring instructions per second
+    from elfcode import Machine
+    machine = Machine(*day(19).parse(lines(name)), compiled=compiled)
+    machine.reg[0] = 1
+    return machine
+
+
+BENCHMARKS = [
+    Benchmark("day1.part1", [1000, 100000, 1000000], lambda size: (array(generate.frequencies(size)).ravel(),),
+              lambda arr: day(1).part1(arr)),
+    Benchmark("day1.part2", [1000, 100000, 1000000], lambda size: (array(generate.frequencies(size)).ravel(),),
+              lambda arr: day(1).part2(arr)),
+    Benchmark("day2.part1", [1000, 100000, 1000000], lambda size: (generate.boxes(size),),
+              lambda boxes: day(2).part1(boxes)),
+    Benchmark("day2.part2", [1000, 10000, 100000], lambda size: (generate.boxes(size),),
+              lambda boxes: day(2).part2(boxes)),
+    Benchmark("day3.part1", [100, 1000, 10000], lambda size: (day(3).parse(generate.claims(size)),),
+              lambda claims: day(3).part1(claims)),
+    Benchmark("day3.part2", [100, 1000, 10000], lambda size: (day(3).parse(generate.claims(size)),),
+              lambda claims: day(3).part2(claims)),
+    Benchmark("day3.sparse", [100, 300, 1000], lambda size: (day(3).parse(
+        generate.claims(size, fabric=10 ** 7, max_size=10 ** 5)),), lambda claims: day(3).part1(claims, sparse=True)),
+    Benchmark("day4.part1", [100, 1000, 10000], lambda size: (day(4)._parse(generate.guard_logs(size)),),
+              lambda guards: day(4).part1(guards)),
+    Benchmark("day4.part2", [100, 1000, 10000], lambda size: (day(4)._parse(generate.guard_logs(size)),),
+              lambda guards: day(4).part2(guards)),
+    Benchmark("day5.part1", [1000, 10000, 100000], lambda size: (generate.polymer(size),),
+              lambda polymer: day(5).part1(polymer)),
+    Benchmark("day5.part2", [1000, 10000, 100000], lambda size: (generate.polymer(size),),
+              lambda polymer: day(5).part2(polymer)),
+    Benchmark("day6.part1", [200, 500, 1000], lambda size: (array(generate.coordinates(50, size), ','),),
+              lambda sites: day(6).part1(sites)),
+    Benchmark("day6.part2", [1000, 10000, 100000], lambda size: (array(generate.coordinates(50, size), ','),),
+              lambda sites: day(6).part2(sites, 10000)),
+    Benchmark("day7.part1", [26, 260, 2600], lambda size: (day(7)._parse(generate.steps(size)),),
+              lambda steps: day(7).part1(steps)),
+    Benchmark("day7.networkx", [26, 260, 2600], lambda size: (day(7)._parse(generate.steps(size)),), networkx_order),
+    Benchmark("day7.part2", [26, 260, 2600], lambda size: (day(7)._parse(generate.steps(size)),),
+              lambda steps: day(7).part2(steps, 5, 60)),
+    puzzle(8, "part1"),
+    puzzle(8, "part2"),
+    Benchmark("day9.part1", [1, 10, 100], lambda size: (411, 71170 * size), lambda *args: day(9).part1(*args)),
+    puzzle(10, "solve"),
+    Benchmark("day11.part2", [10, 20, 30], lambda size: (7989, size), lambda *args: day(11).part2(*args)),
+    puzzle(12, "part1"),
+    puzzle(12, "part2"),
+    puzzle(13, "part1"),
+    puzzle(13, "part2"),
+    Benchmark("day14.part1", [10000, 100000, 1000000], lambda size: (size,), lambda n: day(14).part1(n)),
+    Benchmark("day15.part1", [8, 16, 32], lambda size: (day(15).Maze.from_string(
+        [line.rstrip() for line in generate.maze(size)]),), lambda maze: day(15).part1(maze)),
+    puzzle(16, "part1"),
+    puzzle(16, "part2"),
+    Benchmark("day17.solve", [10, 30, 100], lambda size: day(17)._parse(generate.clay_veins(size, depth=10 * size)),
+              lambda *args: day(17).solve(*args)),
+    Benchmark("day18.solve", [10, 100, 1000], lambda size: (day(18).parse(lines("day18.txt")), size),
+              lambda *args: day(18).solve(*args)),
+    Benchmark("day19.machine", [10000, 100000, 1000000], lambda size: (elfcode_machine("day19.txt"), size),
+              lambda machine, budget: machine.run(budget)),
+    Benchmark("day19.compiled", [10000, 100000, 1000000], lambda size: (elfcode_machine("day19.txt", True), size),
+              lambda machine, budget: machine.run(budget)),
+    puzzle(19, "part1"),
+    puzzle(19, "part2"),
+    Benchmark("day20.part1", [1000, 5000, 20000], lambda size: (day(20).parse(generate.route_regex(size)),),
+              lambda sequence: day(20).part1(sequence)),
+    puzzle(20, "part2"),
+    puzzle(21, "part1"),
+    puzzle(21, "part2"),
+    Benchmark("day22.part2", [100, 300, 726], lambda size: (3066, (13, size)), lambda *args: day(22).part2(*args)),
+    Benchmark("day23.part1", [100, 1000, 10000], lambda size: (day(23)._parse(generate.nanobots(size)),),
+              lambda bots: day(23).part1(bots)),
+    puzzle(23, "part2"),
+    Benchmark("day24.part1", [10, 20, 40], lambda size: (day(24).Game.from_string(generate.army_groups(size)),),
+              lambda game: game.play()),
+    puzzle(24, "part2"),
+    Benchmark("day25.part1", [100, 300, 1000], lambda size: (day(25).parse(generate.points(size)),),
+              lambda points: day(25).part1(points)),
+]
+
+
+def measure(benchmark, size, repeat):
+    times = []
+    for _ in range(repeat):
+        # inputs are rebuilt because some solvers modify them
+        args = benchmark.setup(size)
+        start = time.perf_counter()
+        benchmark.run(*args)
+        times.append(time.perf_counter() - start)
+
+    # one more run to trace the peak memory, since tracing slows down the solver
+    args = benchmark.setup(size)
+    tracemalloc.start()
+    benchmark.run(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times = sorted(times)
+    return {
+        "median": statistics.median(times),
+        "p95": times[min(len(times) - 1, int(round(0.95 * (len(times) - 1))))],
+        "peak_memory": peak,
+        "repeat": repeat
+    }
+
+
+def run(days, repeat=5, max_sizes=None, progress=print):
+    results = {}
+    for benchmark in BENCHMARKS:
+        if int(benchmark.name.split('.')[0][3:]) not in days:
+            continue
+
+        results[benchmark.name] = {}
+        for size in benchmark.sizes[:max_sizes]:
+            try:
+                stats = measure(benchmark, size, repeat)
+            except Exception as e:
+                progress("{:<14} {:>8} {}: {}".format(benchmark.name, size, type(e).__name__, e))
+                continue
+
+            results[benchmark.name][str(size)] = stats
+            progress("{:<14} {:>8} {:>10.4f}s {:>10.4f}s {:>10.1f} MB".format(
+                benchmark.name, size, stats["median"], stats["p95"], stats["peak_memory"] / 2 ** 20))
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results
+    }
+
+
+def compare(report, baseline, threshold):
+    # list of (name, size, baseline median, current median) that got slower than the threshold allows
+    regressions = []
+    for name, sizes in report["results"].items():
+        for size, stats in sizes.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if base and stats["median"] > base["median"] * (1 + threshold):
+                regressions.append((name, size, base["median"], stats["median"]))
+
+    return regressions
+
+
+def main(args):
+    print("{:<14} {:>8} {:>11} {:>11} {:>13}".format("benchmark", "size", "median", "p95", "peak"))
+    report = run(args.days, args.repeat, args.max_sizes)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+
+        print()
+        for name, size, before, after in regressions:
+            print("regression: {} (size {}) {:.4f}s -> {:.4f}s ({:+.0%})".format(
+                name, size, before, after, after / before - 1))
+        if not regressions:
+            print("no regressions beyond {:.0%}".format(args.threshold))
+
+        return 1 if regressions else 0
+
+    return 0
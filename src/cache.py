@@ -0,0 +1,75 @@
+# Advent of Code 2018, Parse Cache
+# (c) blu3r4y
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+
+
+def directory():
+    # caching is opt-in, by pointing AOC_CACHE to a directory
+    return os.environ.get("AOC_CACHE")
+
+
+def parser_version(parser):
+    # any change to the module of the parser invalidates its cached results (helpers might have changed too)
+    source = inspect.getsource(sys.modules[parser.__module__])
+    return "{}.{}:{}".format(parser.__module__, parser.__qualname__, hashlib.sha256(source.encode()).hexdigest())
+
+
+def reader_version(reader):
+    # the reader decides which part of the file the parser sees, so its own source is part of the key
+    try:
+        source = inspect.getsource(reader)
+    except (OSError, TypeError):
+        # builtins and functions without source are identified by their name
+        source = "{}.{}".format(reader.__module__, reader.__qualname__)
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def cached(parser, path, reader=lambda path: open(path).readlines()):
+    # parse the file with parser(reader(path)), or load the result if the same file content
+    # has been read by the same reader and parsed by the same parser version before
+    root = directory()
+    if not root:
+        return parser(reader(path))
+
+    version = reader_version(reader)
+    with open(path, 'rb') as f:
+        key = hashlib.sha256(f.read())
+    key.update(parser_version(parser).encode())
+    key.update(version.encode())
+
+    name = os.path.join(root, "{}.{}-{}-{}".format(parser.__module__, parser.__qualname__,
+                                                   version[:8], key.hexdigest()[:24]))
+
+    # arrays are stored as .npy, everything else (graphs, lists, objects) is pickled
+    if os.path.exists(name + ".npy"):
+        import numpy as np
+        return np.load(name + ".npy", allow_pickle=False)
+    if os.path.exists(name + ".pickle"):
+        with open(name + ".pickle", 'rb') as f:
+            return pickle.load(f)
+
+    result = parser(reader(path))
+    store(name, result)
+
+    return result
+
+
+def store(name, result):
+    os.makedirs(os.path.dirname(name), exist_ok=True)
+
+    if type(result).__module__ == "numpy" and type(result).__name__ == "ndarray" and result.dtype != object:
+        import numpy as np
+        name, write = name + ".npy", lambda f: np.save(f, result, allow_pickle=False)
+    else:
+        name, write = name + ".pickle", lambda f: pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # write to a temporary file first, since other worker processes might read the same entry
+    temporary = "{}.{}.tmp".format(name, os.getpid())
+    with open(temporary, 'wb') as f:
+        write(f)
+    os.replace(temporary, name)
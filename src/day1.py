@@ -1,23 +1,86 @@
 # Advent of Code 2018, Day 1
 # (c) blu3r4y
 
+import mmap
+import os
+
+# numpy stays a module level import, both parts need it to solve, so importing it lazily wouldn't save any time
 import numpy as np
-import itertools
 
 
 def part1(arr):
-    return arr.sum()
+    # arr is an array of changes or an iterable of chunks of it, see read()
+    if isinstance(arr, np.ndarray):
+        return arr.sum()
+    return sum(int(chunk.sum()) for chunk in arr)
 
 
 def part2(arr):
-    frequency, seen = 0, {0}
-    for e in itertools.cycle(arr):
-        frequency += e
-        if frequency in seen:
-            return frequency
-        seen.add(frequency)
+    # frequencies before each change in the first pass, pass m reaches the same ones shifted by m * drift
+    prefix, drift = prefix_sums([arr] if isinstance(arr, np.ndarray) else arr)
+    n = len(prefix)
+
+    # a frequency that is reached twice within the first pass is the earliest repeat
+    order = np.argsort(prefix, kind='stable')
+    twice = order[1:][prefix[order[1:]] == prefix[order[:-1]]]
+    if len(twice) > 0:
+        return int(prefix[twice.min()])
+
+    if drift == 0:
+        # the second pass starts with the first frequency again
+        return 0
+
+    # mirror the frequencies, so that they drift upwards
+    sign = 1 if drift > 0 else -1
+    prefix, drift = sign * prefix, sign * drift
+
+    # frequency i reaches frequency j after (j - i) / drift passes, if both have the same residue modulo the
+    # drift and j is larger, the next larger one within the residue class is reached first
+    residues = prefix % drift
+    order = np.lexsort((prefix, residues))
+    lower, upper = order[:-1], order[1:]
+    same = residues[lower] == residues[upper]
+    if not same.any():
+        # the frequencies never repeat
+        return None
+
+    lower, upper = lower[same], upper[same]
+    passes = (prefix[upper] - prefix[lower]) // drift
+
+    # the repeat that happens first, counted in changes
+    first = np.argmin(passes * n + lower)
+    return sign * int(prefix[upper[first]])
+
+
+def prefix_sums(chunks):
+    # frequencies before each change and the total drift, accumulated chunk by chunk
+    parts, drift = [], 0
+    for chunk in chunks:
+        sums = np.cumsum(chunk, dtype=np.int64)
+        parts.append(sums - chunk + drift)
+        drift += int(sums[-1]) if len(sums) > 0 else 0
+
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64), drift
+
+
+def read(path, chunk_size=1 << 24):
+    # parses the signed integers of a memory-mapped file in chunks of about chunk_size bytes (split at line ends),
+    # so that only one chunk of text is held in memory at once
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        start = 0
+        while start < len(m):
+            end = m.rfind(b'\n', start, start + chunk_size) + 1 if start + chunk_size < len(m) else len(m)
+            if end <= start:
+                # a single line is longer than the chunk
+                end = m.find(b'\n', start + chunk_size) + 1 or len(m)
+
+            yield np.fromstring(m[start:end], dtype=np.int64, sep=' ')
+            start = end
 
 
 if __name__ == "__main__":
-    print(part1(np.loadtxt(r"../assets/day1.txt", dtype=int)))
-    print(part2(np.loadtxt(r"../assets/day1.txt", dtype=int)))
+    print(part1(read(r"../assets/day1.txt")))
+    print(part2(read(r"../assets/day1.txt")))
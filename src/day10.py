@@ -4,7 +4,6 @@
 
 from itertools import count
 
-import matplotlib.pyplot as plt
 import numpy as np
 from parse import parse
 
@@ -27,6 +26,7 @@ def solve(positions, velocities):
             for pos in positions:
                 image[tuple(pos)] = 1
 
+            import matplotlib.pyplot as plt
             plt.imshow(image.T)
             plt.title("Iteration {}".format(i))
             plt.show()
@@ -2,10 +2,11 @@
 # (c) blu3r4y
 
 import numpy as np
-from scipy.ndimage import convolve
 
 
 def part1(serial):
+    from scipy.ndimage import convolve
+
     grid = build_grid(serial)
 
     # 2d convolution over the image with a 3x3 summing kernel, stride = 1 and zero-padding (by offset 1)
@@ -17,6 +18,8 @@ def part1(serial):
 
 
 def part2(serial, max_kernel=30):
+    from scipy.ndimage import convolve
+
     grid = build_grid(serial)
 
     largest_total = -1e10
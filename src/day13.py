@@ -4,24 +4,32 @@
 from collections import defaultdict
 from enum import IntEnum
 from itertools import tee
+from typing import TYPE_CHECKING
 
-import networkx as nx
 import numpy as np
 
+import instrument
 
-def part1(graph: nx.Graph, carts):
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+def part1(graph: 'nx.Graph', carts):
     return solve(graph, carts)
 
 
-def part2(graph: nx.Graph, carts):
+def part2(graph: 'nx.Graph', carts):
     return solve(graph, carts, True)
 
 
-def solve(graph: nx.Graph, carts, delete_on_crash=False):
+@instrument.timed
+def solve(graph: 'nx.Graph', carts, delete_on_crash=False):
     # save the turning strategy with the cart location (x, y) as its key
     turns = defaultdict(lambda: TurnStrategy.Left)
 
     while True:
+        # number of carts per tick
+        instrument.items(len(carts))
 
         # iterate over cart positions
         for pos in sorted(carts.keys()):
@@ -114,7 +122,9 @@ class Direction(IntEnum):
         return zip(options, [tuple(pos + facing.as_offset()) for facing in options])
 
 
-def parse_gridlines(matrix) -> nx.Graph:
+def parse_gridlines(matrix) -> 'nx.Graph':
+    import networkx as nx
+
     g = nx.Graph()
 
     def _pairwise(iterable):
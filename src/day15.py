@@ -10,6 +10,8 @@ from typing import List, Optional
 
 from colorama import Fore, Back, Style
 
+import instrument
+
 
 class Cell:
     """
@@ -200,6 +202,7 @@ class Maze:
         # are their any players of the other faction left?
         return len(self.targets(player)) > 0
 
+    @instrument.timed
     def nearest_cell(self, player: Player) -> Optional[Cell]:
         # identify opponent cells
         targets = self.targets(player)
@@ -207,6 +210,7 @@ class Maze:
         in_range = [cell for target in targets for cell in self.neighbors_air(target)]
         # reachable cells and their distances
         distances = [self.shortest_path_bfs(player, cell) for cell in in_range]
+        instrument.items(len(in_range))
 
         try:
             # nearest cells
@@ -219,6 +223,7 @@ class Maze:
         # sort in reading order and chose first
         return sorted(nearest, key=lambda c: (c.x, c.y))[0]
 
+    @instrument.timed
     def shortest_path_bfs(self, start: Cell, goal: Cell, return_path=False):
         queue, distances = [start], {start: 0}
         parents = {}
@@ -235,6 +240,7 @@ class Maze:
             node = queue.pop(0)
             if node is goal:
                 # path found!
+                instrument.items(len(distances))
                 return _backtrace_path() if return_path else distances[node]
 
             for neighbor in self.neighbors_air(node):
@@ -246,6 +252,7 @@ class Maze:
                     distances[neighbor] = distances[node] + 1
 
         # no path found
+        instrument.items(len(distances))
         return -1
 
     def neighbors_air(self, cell: Cell) -> List[Air]:
@@ -5,8 +5,7 @@ from collections import namedtuple
 
 from parse import parse
 
-OPERATIONS = ['addr', 'addi', 'mulr', 'muli', 'banr', 'bani', 'borr', 'bori',
-              'setr', 'seti', 'gtir', 'gtri', 'gtrr', 'eqir', 'eqri', 'eqrr']
+from elfcode import OPERATIONS, DISPATCH, Machine
 
 Observation = namedtuple("Observation", ["instruction", "before", "after"])
 
@@ -18,7 +17,7 @@ def part1(observations):
 
         # execute all possible candidates
         num_matches = 0
-        for op in OPERATIONS:
+        for op in range(len(OPERATIONS)):
             if obsv.after == execute(obsv.instruction, obsv.before, op):
                 num_matches += 1
 
@@ -31,7 +30,7 @@ def part1(observations):
 
 def part2(observations, program):
     # store possible candidates for every opcode
-    operations = {i: set(OPERATIONS) for i in range(len(OPERATIONS))}
+    operations = {i: set(range(len(OPERATIONS))) for i in range(len(OPERATIONS))}
 
     for obsv in observations:
 
@@ -57,51 +56,17 @@ def part2(observations, program):
     # map set values to scalar
     operations = {i: ops.pop() for i, ops in operations.items()}
 
-    # interpret the program
-    reg = [0, 0, 0, 0]
-    for instruction in program:
-        reg = execute(instruction, reg, operations[instruction[0]])
+    # interpret the program, with the opcodes translated to the operations
+    machine = Machine([(operations[op], a, b, c) for op, a, b, c in program], registers=4)
+    machine.run()
 
-    return reg[0]
+    return machine.reg[0]
 
 
 def execute(instruction, reg, op):
     _, a, b, c = instruction
     reg = list(reg)  # copy register
-
-    if op == 'addr':
-        reg[c] = reg[a] + reg[b]
-    elif op == 'addi':
-        reg[c] = reg[a] + b
-    elif op == 'mulr':
-        reg[c] = reg[a] * reg[b]
-    elif op == 'muli':
-        reg[c] = reg[a] * b
-    elif op == 'banr':
-        reg[c] = reg[a] & reg[b]
-    elif op == 'bani':
-        reg[c] = reg[a] & b
-    elif op == 'borr':
-        reg[c] = reg[a] | reg[b]
-    elif op == 'bori':
-        reg[c] = reg[a] | b
-    elif op == 'setr':
-        reg[c] = reg[a]
-    elif op == 'seti':
-        reg[c] = a
-    elif op == 'gtir':
-        reg[c] = 1 if a > reg[b] else 0
-    elif op == 'gtri':
-        reg[c] = 1 if reg[a] > b else 0
-    elif op == 'gtrr':
-        reg[c] = 1 if reg[a] > reg[b] else 0
-    elif op == 'eqir':
-        reg[c] = 1 if a == reg[b] else 0
-    elif op == 'eqri':
-        reg[c] = 1 if reg[a] == b else 0
-    elif op == 'eqrr':
-        reg[c] = 1 if reg[a] == reg[b] else 0
-
+    DISPATCH[op](reg, a, b, c)
     return reg
 
 
@@ -7,6 +7,8 @@ import numpy as np
 from colorama import Fore, Back, Style
 from parse import parse
 
+import instrument
+
 SPRING_LOCATION = 500, 0
 SPRING, SAND, DRY, WATER, CLAY = 0, 1, 2, 3, 4
 SYMBOLS = {SAND: '.', CLAY: '#', SPRING: '+', WATER: '~', DRY: '|'}
@@ -31,6 +33,7 @@ def solve(grid, area, debug=False):
     return dry_cells + water_cells, water_cells
 
 
+@instrument.timed
 def step(grid, springs):
     def _fill_from(x, y):
         # dry area underneath
@@ -68,6 +71,7 @@ def step(grid, springs):
                     springs.append((x + right, y + down))
 
     # let the water flow from all springs
+    instrument.items(len(springs))
     for spring in springs:
         _fill_from(*spring)
 
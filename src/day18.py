@@ -3,6 +3,8 @@
 
 import numpy as np
 
+import instrument
+
 OPEN, TREE, LUMBER = 0, 1, 2
 NUMBERS = {'.': OPEN, '|': TREE, '#': LUMBER}
 SYMBOLS = {v: k for k, v in NUMBERS.items()}
@@ -19,17 +21,22 @@ def solve(grid, total_minutes):
     while minute < total_minutes:
 
         reference = np.copy(grid)
-        for (x, y), cell in np.ndenumerate(grid):
-            num_tree = num_symbol(neighbors(x, y, reference), TREE)
-            num_lumber = num_symbol(neighbors(x, y, reference), LUMBER)
-
-            # apply transformation rules
-            if cell == OPEN and num_tree >= 3:
-                grid[x, y] = TREE
-            elif cell == TREE and num_lumber >= 3:
-                grid[x, y] = LUMBER
-            elif cell == LUMBER and not (num_lumber > 0 and num_tree > 0):
-                grid[x, y] = OPEN
+        with instrument.span("minute"):
+            for (x, y), cell in np.ndenumerate(grid):
+                num_tree = num_symbol(neighbors(x, y, reference), TREE)
+                num_lumber = num_symbol(neighbors(x, y, reference), LUMBER)
+
+                # apply transformation rules
+                if cell == OPEN and num_tree >= 3:
+                    grid[x, y] = TREE
+                elif cell == TREE and num_lumber >= 3:
+                    grid[x, y] = LUMBER
+                elif cell == LUMBER and not (num_lumber > 0 and num_tree > 0):
+                    grid[x, y] = OPEN
+
+            if instrument.ENABLED:
+                # number of cells that changed
+                instrument.items(np.count_nonzero(grid != reference))
 
         minute += 1
 
@@ -1,97 +1,42 @@
 # Advent of Code 2018, Day 19
 # (c) blu3r4y
 
-ADDR, ADDI, MULR, MULI, BANR, BANI, BORR, BORI, SETR, SETI, GTIR, GTRI, GTRR, EQIR, EQRI, EQRR = range(16)
+from elfcode import ADDR, ADDI, MULR, MULI, BANR, BANI, BORR, BORI, SETR, SETI, GTIR, GTRI, GTRR, EQIR, EQRI, EQRR, \
+    OPERATIONS, Machine
 
-OPERATIONS = ['addr', 'addi', 'mulr', 'muli', 'banr', 'bani', 'borr', 'bori',
-              'setr', 'seti', 'gtir', 'gtri', 'gtrr', 'eqir', 'eqri', 'eqrr']
 
+def solve(instructions, ip, optimize_for_part2=False, profile=None):
+    # the divisor sum loop is recognized and computed in closed form, see elfcode.DIVISOR_SUM,
+    # unless the program is profiled, i.e. interpreted as is for at most that many instructions
+    machine = Machine(instructions, ip, compiled=True, optimized=profile is None, profiled=profile is not None)
 
-def solve(instructions, ip, optimize_for_part2=False):
-    # set register 0 to 1 in part 2
-    reg = [1] + [0] * 5 if optimize_for_part2 else [0] * 6
+    if optimize_for_part2:
+        # set register 0 to 1 in part 2
+        machine.reg[0] = 1
 
     # execute the program as long as the ip is valid
-    while 0 <= reg[ip] < len(instructions):
-        ins = instructions[reg[ip]]
+    machine.run(profile)
 
-        # initialization for part 2 is done at instruction 35
-        if optimize_for_part2 and reg[ip] == 35:
-            return optimized_loop(reg)
+    if profile is not None:
+        explain_program(instructions, ip, machine.hits, machine.back_edges)
 
-        execute(*ins, reg)
-        reg[ip] += 1
+    return machine.reg[0]
 
-    # undo last increment operation
-    reg[ip] -= 1
 
-    return reg[0]
-
-
-def optimized_loop(reg):
-    a, b, c, d, ip, f = reg
-
-    # manually disassembled code ... (too slow)
-
-    # f = 1  # 1
-    # while f <= d:  # 13 - 15
-    #     b = 1  # 2
-    #     while b <= d:  # 9 - 11
-    #         if (f * b) == d:  # 3 - 6
-    #             a += f  # 7
-    #         b += 1  # 8
-    #     f += 1  # 12
-
-    # optimized inner loop, that checks for factors faster
-
-    f = 1  # 1
-    while f <= d:  # 13 - 15
-        if d % f == 0:
-            a += f
-        f += 1  # 12
-
-    return a
-
-
-def execute(op, a, b, c, reg):
-    if op == ADDR:
-        reg[c] = reg[a] + reg[b]
-    elif op == ADDI:
-        reg[c] = reg[a] + b
-    elif op == MULR:
-        reg[c] = reg[a] * reg[b]
-    elif op == MULI:
-        reg[c] = reg[a] * b
-    elif op == BANR:
-        reg[c] = reg[a] & reg[b]
-    elif op == BANI:
-        reg[c] = reg[a] & b
-    elif op == BORR:
-        reg[c] = reg[a] | reg[b]
-    elif op == BORI:
-        reg[c] = reg[a] | b
-    elif op == SETR:
-        reg[c] = reg[a]
-    elif op == SETI:
-        reg[c] = a
-    elif op == GTIR:
-        reg[c] = 1 if a > reg[b] else 0
-    elif op == GTRI:
-        reg[c] = 1 if reg[a] > b else 0
-    elif op == GTRR:
-        reg[c] = 1 if reg[a] > reg[b] else 0
-    elif op == EQIR:
-        reg[c] = 1 if a == reg[b] else 0
-    elif op == EQRI:
-        reg[c] = 1 if reg[a] == b else 0
-    elif op == EQRR:
-        reg[c] = 1 if reg[a] == reg[b] else 0
-
-
-def explain_program(instructions, ip):
+def explain_program(instructions, ip, hits=None, back_edges=None):
     print()
+    if hits is None:
+        for i, ins in enumerate(instructions):
+            print("{:>2} {:<5} {}".format(i, OPERATIONS[ins[0]], explain(*ins, ip)))
+        return
+
+    # heat map of the executed instructions, hot loops are long bars with many jumps back
+    hottest = max(max(hits), 1)
+    print("{:>2} {:<5} {:<20} {:>12} {:<20} {:>10}".format("", "", "", "hits", "", "back edges"))
     for i, ins in enumerate(instructions):
-        print("{:>2} {:<5} {}".format(i, OPERATIONS[ins[0]], explain(*ins, ip)))
+        print("{:>2} {:<5} {:<20} {:>12} {:<20} {:>10}".format(
+            i, OPERATIONS[ins[0]], explain(*ins, ip), hits[i], '#' * round(20 * hits[i] / hottest),
+            back_edges[i] or ''))
 
 
 def explain(op, a, b, c, ip):
@@ -147,5 +92,5 @@ if __name__ == "__main__":
 
     print(solve(*parse(open(r"../assets/day19.txt").readlines()), optimize_for_part2=True))
 
-    # print the entire program for better understanding
-    explain_program(*parse(open(r"../assets/day19.txt").readlines()))
+    # print the entire program for better understanding, along with the hot spots of the first instructions
+    solve(*parse(open(r"../assets/day19.txt").readlines()), profile=100000)
@@ -2,34 +2,54 @@
 # (c) blu3r4y
 
 import numpy as np
-import itertools
 
 
-def part1(boxes):
+def part1(boxes, block=1 << 16):
+    if not boxes:
+        return 0
+
+    # fixed-width byte matrix of the ids, shorter ones are padded with zeros
+    matrix = np.array([box.rstrip('\n').encode() for box in boxes])
+    matrix = matrix.view(np.uint8).reshape(len(boxes), -1)
+
+    # number the characters that occur (the padding is number 0)
+    present = np.zeros(256, dtype=bool)
+    present[0] = True
+    present[matrix.ravel()] = True
+    numbers = np.cumsum(present) - 1
+    symbols = int(numbers[-1]) + 1
+
     doubles, triples = 0, 0
-    for box in boxes:
-        # count occurrences of each char
-        _, counts = np.unique(list(box), return_counts=True)
+    for rows in range(0, len(matrix), block):
+        codes = numbers[matrix[rows:rows + block]]
+
+        # count occurrences of each char, for all rows at once, by offsetting the numbers per row
+        codes = codes + np.arange(len(codes))[:, None] * symbols
+        counts = np.bincount(codes.ravel(), minlength=len(codes) * symbols).reshape(len(codes), symbols)[:, 1:]
 
         # look for at least one double or triple
-        if any(counts == 2):
-            doubles += 1
-        if any(counts == 3):
-            triples += 1
+        doubles += np.count_nonzero((counts == 2).any(axis=1))
+        triples += np.count_nonzero((counts == 3).any(axis=1))
 
     return doubles * triples
 
 
 def part2(boxes):
-    # list of numpy arrays, holding integers
-    boxes = [np.array(list(map(ord, box))) for box in boxes]
-
-    # iterate over the cartesian product
-    for a, b in itertools.product(boxes, boxes):
-        diff = np.count_nonzero(a - b)
-        if diff == 1:
-            # select values, where the difference is zero, and map it back
-            return ''.join(map(chr, a[(a - b) == 0].ravel()))
+    boxes = [box.rstrip('\n') for box in boxes]
+
+    # two boxes that differ in a single position are equal once that position is masked out,
+    # so they collide in a dict of the masked ids (of boxes that are long enough)
+    for i in range(max(map(len, boxes), default=0)):
+        masked = {}
+        for box in boxes:
+            if len(box) <= i:
+                continue
+
+            key = box[:i] + '\0' + box[i + 1:]
+            other = masked.setdefault(key, box)
+            if other != box:
+                # the common characters, without the masked position
+                return box[:i] + box[i + 1:]
 
 
 if __name__ == "__main__":
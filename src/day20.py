@@ -3,10 +3,6 @@
 
 from copy import copy
 
-import networkx as nx
-from parglare import Parser, Grammar
-from parglare.actions import pass_single, pass_inner
-
 GRAMMAR = r"""
 root: '^' expression '$';
 expression: element+;
@@ -22,6 +18,8 @@ direction: /[NSEW]/;
 
 
 def part1(sequence):
+    import networkx as nx
+
     graph = build_graph(sequence)
 
     # longest distance to any other node, starting at (0, 0)
@@ -29,6 +27,8 @@ def part1(sequence):
 
 
 def part2(sequence):
+    import networkx as nx
+
     graph = build_graph(sequence)
 
     # all the shortest path lengths, starting at (0, 0)
@@ -38,6 +38,9 @@ def part2(sequence):
 
 
 def parse(regex):
+    from parglare import Parser, Grammar
+    from parglare.actions import pass_single, pass_inner
+
     actions = {
         "root": pass_inner,
         "branch": pass_inner,
@@ -51,6 +54,8 @@ def parse(regex):
 
 
 def build_graph(sequence):
+    import networkx as nx
+
     graph = nx.Graph()
 
     def _move(directions, starts):
@@ -1,52 +1,41 @@
 # Advent of Code 2018, Day 21
 # (c) blu3r4y
 
-from day19 import execute, parse, explain_program
-
-
-def solve(instructions, ip, return_first_match=True):
-    reg = [0] * 6
-    seen, last_goal = set(), 0
-
-    # execute the program as long as the ip is valid
-    while 0 <= reg[ip] < len(instructions):
-        ins = instructions[reg[ip]]
-
-        # optimize the integer division, which is attempted between instructions 17 - 27
-        if reg[ip] == 17:
-            reg[4] = reg[4] // 256
-            reg[ip] = 8
-            continue
-
-        # manually disassembled code ... (too slow)
-        #
-        # d = 0
-        # while True:
-        #     c = d + 1
-        #     c = c * 256
-        #
-        #     if c > e:
-        #         e = d
-        #         break
-        #     else:
-        #         d = d + 1
-
-        # instruction 28 compares the value in register 0 with register 5
-        if reg[ip] == 28:
-            goal = reg[5]
-
-            # [...] halt after executing the fewest instructions
-            if return_first_match:
-                return goal
-
-            # [...] halt after executing the most instructions
-            if goal in seen:
-                return last_goal
-            seen.add(goal)
-            last_goal = goal
-
-        execute(*ins, reg)
-        reg[ip] += 1
+from day19 import parse, explain_program
+from elfcode import EQRR, Machine
+
+
+def solve(instructions, ip, return_first_match=True, profile=None):
+    # the integer division loop is recognized and computed in closed form, see elfcode.DIVISION,
+    # unless the program is profiled, i.e. interpreted as is for at most that many instructions
+    machine = Machine(instructions, ip, compiled=True, optimized=profile is None, profiled=profile is not None)
+    seen, goals = set(), []
+
+    # the only instruction that reads register 0 compares it with the goal register
+    index, (_, a, b, _) = next((i, ins) for i, ins in enumerate(instructions) if ins[0] == EQRR and 0 in ins[1:3])
+    register = b if a == 0 else a
+
+    def _compare(m):
+        goal = m.reg[register]
+
+        # [...] halt after executing the fewest instructions
+        if return_first_match:
+            goals.append(goal)
+            return True
+
+        # [...] halt after executing the most instructions
+        if goal in seen:
+            return True
+        seen.add(goal)
+        goals.append(goal)
+
+    machine.hooks[index] = _compare
+    machine.run(profile)
+
+    if profile is not None:
+        explain_program(instructions, ip, machine.hits, machine.back_edges)
+
+    return goals[-1] if goals else None
 
 
 if __name__ == "__main__":
@@ -54,5 +43,5 @@ if __name__ == "__main__":
     print(solve(*parse(open(r"../assets/day21.txt").readlines()),
                 return_first_match=False))
 
-    # print the entire program for better understanding
-    explain_program(*parse(open(r"../assets/day21.txt").readlines()))
+    # print the entire program for better understanding, along with the hot spots of the first instructions
+    solve(*parse(open(r"../assets/day21.txt").readlines()), return_first_match=False, profile=100000)
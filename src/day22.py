@@ -6,6 +6,8 @@ from queue import PriorityQueue
 import numpy as np
 from colorama import Fore, Style
 
+import instrument
+
 NOTOOL, TORCH, GEAR = 0, 1, 2
 ROCKY, WET, NARROW = 0, 1, 2
 SYMBOLS = {0: '.', 1: '=', 2: '|'}
@@ -51,6 +53,7 @@ def build_cave(depth, target, overhang=(100, 100)):
     return cave
 
 
+@instrument.timed
 def a_star_search(cave, start, goal):
     start = (start, TORCH)
     goal = (goal, TORCH)
@@ -111,8 +114,10 @@ def a_star_search(cave, start, goal):
     # parent relationships for backtracking the path
     parents = {start: None}
 
+    expanded = 0
     while not fringe.empty():
         _, cur = fringe.get()
+        expanded += 1
 
         # goal reached!
         if cur == goal:
@@ -129,6 +134,7 @@ def a_star_search(cave, start, goal):
                 fringe.put((priority, nxt))
                 parents[nxt] = cur
 
+    instrument.items(expanded)
     return parents, costs
 
 
@@ -1,7 +1,6 @@
 # Advent of Code 2018, Day 23
 # (c) blu3r4y
 
-import networkx as nx
 from parse import parse
 
 X, Y, Z, RANGE = 0, 1, 2, 3
@@ -18,6 +17,8 @@ def part1(bots):
 
 
 def part2(bots):
+    import networkx as nx
+
     # build a graph with edges between overlapping nanobots
     graph = nx.Graph()
     for bot in bots:
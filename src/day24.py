@@ -7,6 +7,8 @@ from itertools import count
 
 from parse import parse
 
+import instrument
+
 
 class Faction(IntEnum):
     Immune = 0,
@@ -87,6 +89,7 @@ class Game():
             if winner == Faction.Immune:
                 return winner, score
 
+    @instrument.timed
     def play(self, boost=0):
         # apply boost
         for group in self.groups[Faction.Immune]:
@@ -94,6 +97,9 @@ class Game():
 
         # fight for as long as both groups have units left
         while all([any(g) for g in self.groups]):
+            # number of groups per round
+            instrument.items(sum(len(g) for g in self.groups))
+
             # let groups select targets, in order of largest EP (break ties on IV)
             groups = self.groups[Faction.Immune] + self.groups[Faction.Infect]
             groups = sorted(groups, key=lambda g: (-g.ep, -g.iv))
@@ -2,12 +2,13 @@
 # (c) blu3r4y
 
 import numpy as np
-import networkx as nx
 
 from itertools import product
 
 
 def part1(points):
+    import networkx as nx
+
     graph = nx.Graph()
     for i, j in product(range(len(points)), repeat=2):
         # two points share a constellation if the are <= 3 apart
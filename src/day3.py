@@ -9,29 +9,65 @@ import numpy as np
 Claim = collections.namedtuple('Claim', ['id', 'x', 'y', 'w', 'h'])
 
 
-def part1(claims):
+def part1(claims, sparse=None):
+    x0, y0, x1, y1, area = grid(claims, sparse)
+
     # overlapping claims have cell numbers greater than 1
-    return np.sum(fill_claims(claims) > 1)
+    return np.sum((fill_claims(x0, y0, x1, y1) > 1) * area)
+
+
+def part2(claims, sparse=None):
+    x0, y0, x1, y1, area = grid(claims, sparse)
+    _, _, w, h = rectangles(claims)
+
+    # area that is claimed exactly once, within each claim
+    table = summed_area_table((fill_claims(x0, y0, x1, y1) == 1) * area)
+    once = table[x1, y1] - table[x0, y1] - table[x1, y0] + table[x0, y0]
+
+    # the claim whose cells are all equal to 1 has not been overlapped
+    index = np.flatnonzero(once == w * h)
+    return claims[index[0]].id if len(index) > 0 else None
+
+
+def grid(claims, sparse=None):
+    # corners of the claims in grid coordinates and the area of the grid cells, in the sparse mode the grid only
+    # has lines at the edges of the claims, so that it doesn't depend on the coordinate range (None picks the
+    # mode with fewer cells)
+    x, y, w, h = rectangles(claims)
+    xs, ys = np.unique(np.concatenate((x, x + w))), np.unique(np.concatenate((y, y + h)))
+
+    if sparse is None:
+        sparse = len(xs) * len(ys) < (xs[-1] + 1) * (ys[-1] + 1)
+
+    if not sparse:
+        return x, y, x + w, y + h, 1
+
+    area = np.outer(np.diff(xs), np.diff(ys))
+    return np.searchsorted(xs, x), np.searchsorted(ys, y), np.searchsorted(xs, x + w), np.searchsorted(ys, y + h), area
+
 
+def fill_claims(x0, y0, x1, y1):
+    # difference array, every claim adds 1 at its top left corner and cancels it out beyond its other corners
+    diff = np.zeros((np.amax(x1) + 1, np.amax(y1) + 1), dtype=int)
+    np.add.at(diff, (x0, y0), 1)
+    np.add.at(diff, (x1, y0), -1)
+    np.add.at(diff, (x0, y1), -1)
+    np.add.at(diff, (x1, y1), 1)
 
-def part2(claims):
-    arr = fill_claims(claims)
-    for c in claims:
-        # the claim whose cells are all equal to 1 has not been overlapped
-        if np.all(arr[c.x:c.x + c.w, c.y:c.y + c.h] == 1):
-            return c.id
+    # the cumulative sums yield the number of claims per cell
+    return np.cumsum(np.cumsum(diff, axis=0), axis=1)[:-1, :-1]
 
 
-def fill_claims(claims):
-    # create an empty matrix big enough to hold all claims
-    shape = np.amax(np.array([(c.x + c.w, c.y + c.h) for c in claims]), axis=0)
-    arr = np.zeros(shape, dtype=int)
+def summed_area_table(arr):
+    # table[x, y] is the sum of arr[:x, :y]
+    table = np.zeros((arr.shape[0] + 1, arr.shape[1] + 1), dtype=np.int64)
+    table[1:, 1:] = np.cumsum(np.cumsum(arr, axis=0, dtype=np.int64), axis=1)
+    return table
 
-    for c in claims:
-        # for every claim, increase the value within those cells
-        arr[c.x:c.x + c.w, c.y:c.y + c.h] += 1
 
-    return arr
+def rectangles(claims):
+    # columns x, y, w and h of all claims
+    return np.array([(c.x, c.y, c.w, c.h) for c in claims], dtype=int).reshape(-1, 4).T
 
 
 def parse(lines):
@@ -2,15 +2,18 @@
 # (c) blu3r4y
 
 import datetime
+import re
 
 import numpy as np
 
-from parse import parse
-from functools import partial
-from collections import namedtuple, defaultdict
+from collections import namedtuple
 
+# times are in minutes since 0001-01-01 00:00, asleep holds [falls asleep, wakes up] pairs
 Guard = namedtuple("Guard", ["id", "shift", "asleep"])
 
+# date, hour, minute and the event, which is a guard id, 'f' (falls asleep) or '' (wakes up)
+RECORD = re.compile(r'\[(\d+-\d+-\d+) (\d+):(\d+)\] (?:Guard #(\d+) begins shift|(f)alls asleep|wakes up)')
+
 
 def part1(guards):
     return solve(guards)[0]
@@ -21,34 +24,50 @@ def part2(guards):
 
 
 def solve(guards):
-    # fill a matrix with the slept minutes, per guard
-    minutes = defaultdict(partial(np.zeros, 60))
-    for guard in guards:
-        for asleep in guard.asleep:
-            t = asleep[0]
-            while t < asleep[1]:
-                minutes[guard.id][t.minute] += 1
-                t += datetime.timedelta(minutes=1)
+    # every nap as (guard, first minute, duration in minutes)
+    naps = np.array([(guard.id, start % 60, end - start)
+                     for guard in guards for start, end in guard.asleep], dtype=int).reshape(-1, 3)
+
+    # one row per guard, in the order of their first nap
+    ids, first, rows = np.unique(naps[:, 0], return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    ids, rows = ids[order], np.argsort(order)[rows.ravel()]
+
+    # fill a matrix with the slept minutes, per guard, from a difference array that spans two hours
+    # (naps may run past the full hour) and naps that last longer than an hour count every minute once per hour
+    laps, rest = np.divmod(naps[:, 2], 60)
+    diff = np.zeros((len(ids), 121), dtype=int)
+    np.add.at(diff, (rows, naps[:, 1]), 1)
+    np.add.at(diff, (rows, naps[:, 1] + rest), -1)
+    counts = np.cumsum(diff, axis=1)
+    hours = np.bincount(rows, weights=laps, minlength=len(ids)).astype(int)
+    minutes = counts[:, :60] + counts[:, 60:120] + hours[:, None]
 
     # strategy 1: most slept minute of the most sleepy guard
-    guard1 = max(minutes.keys(), key=lambda guard: np.sum(minutes[guard]))
+    guard1 = np.argmax(minutes.sum(axis=1))
 
     # strategy 2: most slept minute of all guards
-    guard2 = max(minutes.keys(), key=lambda guard: np.max(minutes[guard]))
+    guard2 = np.argmax(minutes.max(axis=1))
 
-    return guard1 * np.argmax(minutes[guard1]), guard2 * np.argmax(minutes[guard2])
+    return ids[guard1] * np.argmax(minutes[guard1]), ids[guard2] * np.argmax(minutes[guard2])
 
 
 def _parse(lines):
-    guards = []
-    for line in sorted(lines, key=lambda line: parse("[{time:ti}] {}", line)['time']):
-        begin_ = parse("[{time:ti}] Guard #{id:d} begins shift", line)
-        asleep_ = parse("[{time:ti}] falls asleep", line)
-        wakeup_ = parse("[{time:ti}] wakes up", line)
-
-        if begin_:  guards.append(Guard(id=begin_['id'], shift=begin_['time'], asleep=[]))
-        if asleep_: guards[-1].asleep.append([asleep_['time'], None])
-        if wakeup_: guards[-1].asleep[-1][1] = wakeup_['time']
+    # the timestamps are zero-padded, so the raw strings sort chronologically
+    records = sorted(RECORD.findall(''.join(lines)), key=lambda record: record[:3])
+
+    guards, days = [], {}
+    for date, hour, minute, guard, asleep in records:
+        if date not in days:
+            days[date] = datetime.date(*map(int, date.split('-'))).toordinal() * 1440
+        time = days[date] + int(hour) * 60 + int(minute)
+
+        if guard:
+            guards.append(Guard(id=int(guard), shift=time, asleep=[]))
+        elif asleep:
+            guards[-1].asleep.append([time, None])
+        else:
+            guards[-1].asleep[-1][1] = time
 
     return guards
 
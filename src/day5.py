@@ -1,37 +1,80 @@
 # Advent of Code 2018, Day 5
 # (c) blu3r4y
 
-import re
+import mmap
+import multiprocessing
+
+# reduced polymers with at least that many units are shortened by a pool of processes
+PARALLEL_SIZE = 1 << 20
+
+# the reduced polymer, in the worker processes of the pool
+_shared = None
 
 
 def part1(polymer):
-    result = []
-    for element in polymer:
-        # remove the last element if the new one would react with it
-        if len(result) > 0 and reactive(element, result[-1]):
-            result.pop()
-        else:
-            result.append(element)
+    return len(reduce(polymer))
+
+
+def part2(polymer, processes=None):
+    # removing all units of one type commutes with the reduction, so every candidate starts from the reduced polymer
+    reduced = bytes(reduce(polymer))
+    types = set(reduced.lower())
+
+    # look for the shortest polymer, types that were reduced away entirely leave it as is
+    if len(reduced) < PARALLEL_SIZE or len(types) < 2:
+        lengths = [_without(reduced, t) for t in types]
+    else:
+        with multiprocessing.Pool(processes, _share, (reduced,)) as pool:
+            lengths = pool.map(_shared_without, types)
+
+    return min(lengths, default=len(reduced))
+
 
-    return len(result)
+def _without(polymer, unit):
+    # length of the polymer after removing all units of one type (in both cases)
+    return part1(polymer.translate(None, bytes([unit]) + bytes([unit]).upper()))
+
+
+def _share(polymer):
+    global _shared
+    _shared = polymer
+
+
+def _shared_without(unit):
+    return _without(_shared, unit)
+
+
+def reduce(polymer):
+    # the units are bytes, the stack is preallocated and only the index of its top moves,
+    # the last unit on the stack is kept in a variable (-1 if the stack is empty)
+    stack, top, last = bytearray(len(polymer)), 0, -1
+    for unit in units(polymer):
+        # remove the last unit if the new one would react with it,
+        # upper and lower case letters only differ in one bit ('a' ^ 'A' = 32)
+        if unit ^ last == 32:
+            top -= 1
+            last = stack[top - 1] if top > 0 else -1
+        else:
+            stack[top] = last = unit
+            top += 1
 
+    return stack[:top]
 
-def part2(polymer):
-    units = set(polymer.lower())
 
-    # remove all units of one type and look for the shortest polymer
-    lengths = [part1(re.sub(u, '', polymer, flags=re.IGNORECASE)) for u in units]
-    return min(lengths)
+def units(polymer):
+    # view on the bytes of the polymer, which might be a string, bytes or a memory-mapped file
+    return memoryview(polymer.encode() if isinstance(polymer, str) else polymer)
 
 
-def reactive(a, b):
-    # upper and lower case letters are exactly 32 values apart ('A' - 'a' = 32)
-    return abs(ord(a) - ord(b)) == 32
+def read(path):
+    # memory-maps the polymer, the mapping stays valid after the file is closed
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 if __name__ == "__main__":
     print(part1("dabAcCaCBAcCcaDA"))
-    print(part1(open(r"../assets/day5.txt").read()))
+    print(part1(read(r"../assets/day5.txt")))
 
     print(part2("dabAcCaCBAcCcaDA"))
-    print(part2(open(r"../assets/day5.txt").read()))
+    print(part2(read(r"../assets/day5.txt")))
@@ -4,18 +4,21 @@
 import numpy as np
 
 
-def part1(coordinates):
-    # create a matrix filled with -1 big enough to hold all coordinates
+def part1(coordinates, block=1 << 22):
+    # create a matrix big enough to hold all coordinates
     shape = np.amax(coordinates, axis=0) + (1, 1)
-    matrix = np.full(shape, -1)
+    matrix = np.empty(shape, dtype=int)
 
-    for cell, _ in np.ndenumerate(matrix):
-        # calculate manhattan distance to every coordinate
-        dists = np.sum(np.abs(cell - coordinates), axis=1)
+    # manhattan distances along each axis, from every row and column to every coordinate
+    dx = np.abs(np.arange(shape[0])[:, None] - coordinates[:, 0])
+    dy = np.abs(np.arange(shape[1])[:, None] - coordinates[:, 1])
+
+    # distances of a block of rows to all coordinates at once, with about block elements
+    rows = max(1, block // (shape[1] * len(coordinates)))
+    for x in range(0, shape[0], rows):
+        dists = dx[x:x + rows, None, :] + dy[None, :, :]
         # assign the minimum distance to the cell, if it is unique
-        mins = np.argwhere(dists == np.amin(dists))
-        if len(mins) == 1:
-            matrix[cell] = mins[0][0]
+        matrix[x:x + rows] = nearest(dists)
 
     # invalidate infinite regions
     infinite = np.unique(np.hstack((matrix[(0, -1), :], matrix[:, (0, -1)].T)))
@@ -27,18 +30,72 @@ def part1(coordinates):
 
 
 def part2(coordinates, min_dist):
-    # create an empty matrix big enough to hold all coordinates
-    shape = np.amax(coordinates, axis=0) + (1, 1)
-    matrix = np.zeros(shape, dtype=int)
+    # the total distance separates into fx[x] + fy[y], each grows by the number of coordinates per step beyond
+    # the outermost coordinates, so no cell further away than min_dist / n can be within the region
+    margin = min_dist // len(coordinates) + 1
+    fx = total_distances(coordinates[:, 0], margin)
+    fy = np.sort(total_distances(coordinates[:, 1], margin))
+
+    # for every column, the number of rows that keep the total distance small enough
+    return int(np.sum(np.searchsorted(fy, min_dist - fx, side='left')))
+
+
+def total_distances(values, margin=0):
+    # sum of the distances to all values, from every position within the range of values extended by margin
+    values = np.sort(values)
+    positions = np.arange(values[0] - margin, values[-1] + margin + 1)
+    return distance_sums(values, np.concatenate(([0], np.cumsum(values))), positions)
+
+
+def distance_sums(values, prefix, positions):
+    # sum of the distances from each position to the sorted values, with their prefix sums (starting at 0),
+    # values before a position contribute position - value, the others value - position
+    before = np.searchsorted(values, positions, side='left')
+    return positions * before - prefix[before] + (prefix[-1] - prefix[before]) - positions * (len(values) - before)
+
+
+def nearest(dists):
+    # index of the minimum along the last axis, or -1 if it is not unique
+    labels = np.argmin(dists, axis=-1)
+    if dists.shape[-1] > 1:
+        smallest = np.partition(dists, 1, axis=-1)
+        labels[smallest[..., 0] == smallest[..., 1]] = -1
+
+    return labels
+
+
+class SiteIndex:
+    """
+    Answers nearest coordinate and total distance queries for arbitrary points, inside or outside of the grid
+    """
+
+    def __init__(self, coordinates):
+        from scipy.spatial import cKDTree
+
+        self.coordinates = np.asarray(coordinates)
+        self.tree = cKDTree(self.coordinates)
+
+        # sorted values and their prefix sums per axis, the total distance separates into both axes
+        self.axes = []
+        for values in np.sort(self.coordinates, axis=0).T:
+            self.axes.append((values, np.concatenate(([0], np.cumsum(values)))))
+
+    def nearest(self, points):
+        # index of the nearest coordinate (manhattan distance) per point, or -1 if several are equally near
+        points = np.atleast_2d(points)
+        k = min(2, len(self.coordinates))
+        dists, labels = self.tree.query(points, k=k, p=1)
+        if k == 1:
+            return labels.reshape(len(points))
 
-    for cell, _ in np.ndenumerate(matrix):
-        # sum manhattan distance to every coordinate
-        dist = np.sum(np.abs(cell - coordinates))
-        # assign a marker if the distance is small enough
-        if dist < min_dist:
-            matrix[cell] = 1
+        labels = labels[:, 0].copy()
+        labels[dists[:, 0] == dists[:, 1]] = -1
+        return labels
 
-    return np.sum(matrix)
+    def total_distance(self, points):
+        # sum of the manhattan distances to all coordinates, per point
+        points = np.atleast_2d(points)
+        return sum(distance_sums(values, prefix, points[:, axis]) for axis, (values, prefix) in enumerate(self.axes))
 
 
 if __name__ == "__main__":
@@ -1,57 +1,109 @@
 # Advent of Code 2018, Day 7
 # (c) blu3r4y
 
-import networkx as nx
+import heapq
+from collections import namedtuple
 
 from parse import parse
 
+# steps have integer ids in alphabetical order of their names, the successors of step i are
+# targets[offsets[i]:offsets[i + 1]] (compressed sparse rows) and indegree counts their predecessors
+Graph = namedtuple("Graph", ["names", "offsets", "targets", "indegree"])
 
-def part1(steps):
-    g = nx.DiGraph()
-    g.add_edges_from(steps)
 
+def part1(steps):
     # this is problem is exactly the topological sort of a graph
-    return ''.join(nx.lexicographical_topological_sort(g))
+    g = graph(steps)
+    return ''.join(g.names[step] for step in lexicographical_topological_sort(g))
 
 
 def part2(steps, num_workers, offset):
-    g = nx.DiGraph()
-    g.add_edges_from(steps)
-
-    # dicts storing the time left and active task/node per worker
-    times = {i: 0 for i in range(num_workers)}
-    tasks = {i: None for i in range(num_workers)}
-
-    time = 0
-
-    # process the graph until there are no nodes left
-    while g.number_of_nodes() > 0:
-
-        # nodes without predecessors that are not assigned to a worker already
-        fringe = filter(lambda e: len(list(g.predecessors(e))) == 0, nx.nodes(g))
-        fringe = list(sorted(set(fringe) - set(tasks.values())))
-
-        # workers without tasks ...
-        for worker in filter(lambda w: times[w] <= 0, times.keys()):
-            if len(fringe) == 0:
-                break
-
-            # assign the first task from the fringe
-            task = fringe.pop(0)
-            if task:
-                times[worker] = step_length(task, offset)
-                tasks[worker] = task
-
-        # decrease the time on each worker ...
-        for worker in times.keys():
-            times[worker] -= 1
-            if times[worker] == 0:
-                # remove finished nodes
-                g.remove_node(tasks[worker])
+    g = graph(steps)
+    schedule = Schedule(g)
+
+    # (completion time, step) per busy worker
+    busy, time = [], 0
+
+    # process the graph until there are no steps left
+    while schedule.ready or busy:
+        # idle workers take the first steps that can begin
+        while schedule.ready and len(busy) < num_workers:
+            step = schedule.pop()
+            heapq.heappush(busy, (time + step_length(g.names[step], offset), step))
+
+        # jump to the next completion, steps that complete at the same time finish together
+        time = busy[0][0]
+        while busy and busy[0][0] == time:
+            _, step = heapq.heappop(busy)
+            schedule.finish(step)
+
+    schedule.check()
+    return time
 
-        time += 1
 
-    return time
+def graph(steps):
+    names = sorted({a for a, _ in steps} | {b for _, b in steps})
+    ids = {name: i for i, name in enumerate(names)}
+
+    # duplicate edges are dropped
+    edges = {(ids[a], ids[b]) for a, b in steps}
+
+    offsets, indegree = [0] * (len(names) + 1), [0] * len(names)
+    for a, b in edges:
+        offsets[a + 1] += 1
+        indegree[b] += 1
+    for i in range(len(names)):
+        offsets[i + 1] += offsets[i]
+
+    # place the successors in the rows of their source (counting sort)
+    targets, fill = [0] * len(edges), offsets[:-1]
+    for a, b in edges:
+        targets[fill[a]] = b
+        fill[a] += 1
+
+    return Graph(names, offsets, targets, indegree)
+
+
+def lexicographical_topological_sort(g):
+    # kahn's algorithm, which takes the smallest step that can begin next
+    schedule = Schedule(g)
+    while schedule.ready:
+        step = schedule.pop()
+        schedule.finish(step)
+        yield step
+
+    schedule.check()
+
+
+class Schedule:
+    """
+    Steps of a graph that can begin, i.e. all their predecessors are finished
+    """
+
+    def __init__(self, g):
+        self.graph = g
+        self.indegree = list(g.indegree)
+        self.ready = [step for step, degree in enumerate(self.indegree) if degree == 0]
+        heapq.heapify(self.ready)
+        self.finished = 0
+
+    def pop(self):
+        # the smallest step that can begin
+        return heapq.heappop(self.ready)
+
+    def finish(self, step):
+        self.finished += 1
+        offsets, targets, indegree = self.graph.offsets, self.graph.targets, self.indegree
+        for successor in targets[offsets[step]:offsets[step + 1]]:
+            indegree[successor] -= 1
+            if indegree[successor] == 0:
+                heapq.heappush(self.ready, successor)
+
+    def check(self):
+        # no step can begin any more, the steps that never could are part of a cycle
+        if self.finished < len(self.graph.names):
+            raise ValueError("the steps contain a cycle, {} of {} steps can never begin"
+                             .format(len(self.graph.names) - self.finished, len(self.graph.names)))
 
 
 def step_length(ch, offset):
@@ -1,7 +1,6 @@
 # Advent of Code 2018, Day 8
 # (c) blu3r4y
 
-import networkx as nx
 import numpy as np
 
 
@@ -27,6 +26,8 @@ def part2(nodes):
 
 
 def _build_tree(nodes):
+    import networkx as nx
+
     tree, metadata = nx.DiGraph(), dict()
 
     def _read_node(name, parent, i):
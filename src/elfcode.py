@@ -0,0 +1,458 @@
+# Advent of Code 2018, ElfCode (Days 16, 19 and 21)
+# (c) blu3r4y
+
+import sys
+
+ADDR, ADDI, MULR, MULI, BANR, BANI, BORR, BORI, SETR, SETI, GTIR, GTRI, GTRR, EQIR, EQRI, EQRR = range(16)
+
+OPERATIONS = ['addr', 'addi', 'mulr', 'muli', 'banr', 'bani', 'borr', 'bori',
+              'setr', 'seti', 'gtir', 'gtri', 'gtrr', 'eqir', 'eqri', 'eqrr']
+
+
+def _addr(reg, a, b, c):
+    reg[c] = reg[a] + reg[b]
+
+
+def _addi(reg, a, b, c):
+    reg[c] = reg[a] + b
+
+
+def _mulr(reg, a, b, c):
+    reg[c] = reg[a] * reg[b]
+
+
+def _muli(reg, a, b, c):
+    reg[c] = reg[a] * b
+
+
+def _banr(reg, a, b, c):
+    reg[c] = reg[a] & reg[b]
+
+
+def _bani(reg, a, b, c):
+    reg[c] = reg[a] & b
+
+
+def _borr(reg, a, b, c):
+    reg[c] = reg[a] | reg[b]
+
+
+def _bori(reg, a, b, c):
+    reg[c] = reg[a] | b
+
+
+def _setr(reg, a, b, c):
+    reg[c] = reg[a]
+
+
+def _seti(reg, a, b, c):
+    reg[c] = a
+
+
+def _gtir(reg, a, b, c):
+    reg[c] = 1 if a > reg[b] else 0
+
+
+def _gtri(reg, a, b, c):
+    reg[c] = 1 if reg[a] > b else 0
+
+
+def _gtrr(reg, a, b, c):
+    reg[c] = 1 if reg[a] > reg[b] else 0
+
+
+def _eqir(reg, a, b, c):
+    reg[c] = 1 if a == reg[b] else 0
+
+
+def _eqri(reg, a, b, c):
+    reg[c] = 1 if reg[a] == b else 0
+
+
+def _eqrr(reg, a, b, c):
+    reg[c] = 1 if reg[a] == reg[b] else 0
+
+
+# operation per opcode, they modify the registers in-place
+DISPATCH = [_addr, _addi, _mulr, _muli, _banr, _bani, _borr, _bori,
+            _setr, _seti, _gtir, _gtri, _gtrr, _eqir, _eqri, _eqrr]
+
+
+COMPARISONS = {GTIR, GTRI, GTRR, EQIR, EQRI, EQRR}
+
+# number of successor blocks that are compiled into a block
+INLINE_DEPTH = 3
+
+# python expressions per opcode, formatted with the operands (registers are already resolved to names)
+EXPRESSIONS = ['{a} + {b}', '{a} + {b}', '{a} * {b}', '{a} * {b}', '{a} & {b}', '{a} & {b}', '{a} | {b}', '{a} | {b}',
+               '{a}', '{a}', '1 if {a} > {b} else 0', '1 if {a} > {b} else 0', '1 if {a} > {b} else 0',
+               '1 if {a} == {b} else 0', '1 if {a} == {b} else 0', '1 if {a} == {b} else 0']
+
+# whether the operands a and b refer to registers, per opcode
+OPERANDS = [(True, True), (True, False), (True, True), (True, False), (True, True), (True, False),
+            (True, True), (True, False), (True, False), (False, False), (False, True), (True, False),
+            (True, True), (False, True), (True, False), (True, True)]
+
+
+def compile_program(instructions, ip=None, registers=6, breakpoints=()):
+    # translates the program into a python function run(reg, pc, executed, limit) -> (pc, executed), which keeps
+    # the registers in local variables and executes whole basic blocks at once, it returns as soon as it reaches
+    # a breakpoint, a jump target it doesn't know or if the next blocks might exceed the limit of executed
+    # instructions, the second return value is the set of instruction indexes where it can be entered
+
+    def _operand(i, value, is_register):
+        # the bound register always holds the index of the executing instruction
+        if not is_register:
+            return str(value)
+        return str(i) if value == ip else 'r{}'.format(value)
+
+    def _expression(i):
+        op, a, b, _ = instructions[i]
+        reg_a, reg_b = OPERANDS[op]
+        return EXPRESSIONS[op].format(a=_operand(i, a, reg_a), b=_operand(i, b, reg_b))
+
+    # leaders start a basic block: the first instruction, breakpoints, jump targets and instructions after jumps
+    leaders = {0} | set(breakpoints)
+    for i, (op, a, b, c) in enumerate(instructions):
+        if c == ip:
+            leaders.add(i + 1)
+            expression = _expression(i)
+            if 'r' not in expression:
+                # constant jump
+                leaders.add(eval(expression) + 1)
+            else:
+                # relative jumps usually add the result of a comparison, i.e. they skip one instruction
+                leaders.add(i + 2)
+
+    entries = {i for i in leaders - set(breakpoints) if 0 <= i < len(instructions)}
+
+    def _block(start, depth=0, executed=0):
+        # executed counts the instructions of the enclosing inlined blocks, it is added once per path
+        lines, flags, i = [], set(), start
+        while True:
+            op, a, b, c = instructions[i]
+            expression = _expression(i)
+            i += 1
+
+            if c == ip:
+                break
+
+            # remember registers that hold the result of a comparison, i.e. 0 or 1
+            flags = flags | {c} if op in COMPARISONS else flags - {c}
+            lines.append('r{} = {}'.format(c, expression))
+
+            if i in leaders or i >= len(instructions):
+                # fall through to the next block
+                expression = str(i - 1)
+                break
+
+        length = i - start
+        executed += length
+
+        op, a, b, c = instructions[i - 1]
+        if 'r' not in expression:
+            successor, successor_length = _goto(eval(expression) + 1, depth, executed)
+            lines += successor
+        elif op == ADDR and ip in (a, b) and ({a, b} - {ip}) <= flags:
+            # skip the next instruction if the flag is set
+            flag = ({a, b} - {ip}).pop()
+            taken, taken_length = _goto(i + 1, depth, executed)
+            skipped, skipped_length = _goto(i, depth, executed)
+
+            if length >= 2 and instructions[i - 2][0] in COMPARISONS and instructions[i - 2][3] == flag:
+                # branch on the comparison right away, instead of storing and testing the flag
+                condition = lines.pop()[len('r{} = 1 if '.format(flag)):-len(' else 0')]
+                lines += ['if {}:'.format(condition), '    r{} = 1'.format(flag)] + _indent(taken) + \
+                         ['else:', '    r{} = 0'.format(flag)] + _indent(skipped)
+            else:
+                lines += ['if r{}:'.format(flag)] + _indent(taken) + ['else:'] + _indent(skipped)
+            successor_length = max(taken_length, skipped_length)
+        else:
+            lines += ['executed += {}'.format(executed), 'pc = ({}) + 1'.format(expression)]
+            successor_length = 0
+
+        # code and the maximum number of instructions it executes
+        return lines, length + successor_length
+
+    def _goto(target, depth, executed):
+        # successor blocks are inlined up to some depth, which saves going through the dispatcher
+        if depth < INLINE_DEPTH and target in entries:
+            return _block(target, depth + 1, executed)
+        return ['executed += {}'.format(executed), 'pc = {}'.format(target)], 0
+
+    def _entry(start):
+        # the limit is only checked before entering the inlined blocks, the interpreter executes the rest
+        lines, length = _block(start)
+        return ['if executed + {} > limit:'.format(length), '    break'] + lines
+
+    def _indent(lines, indent=4):
+        return [' ' * indent + line for line in lines]
+
+    def _dispatch(indexes):
+        # binary search over the block entries
+        if len(indexes) == 1:
+            return ['if pc == {}:'.format(indexes[0])] + _indent(_entry(indexes[0])) + ['else:', '    break']
+
+        middle = len(indexes) // 2
+        return ['if pc < {}:'.format(indexes[middle])] + _indent(_dispatch(indexes[:middle])) + \
+               ['else:'] + _indent(_dispatch(indexes[middle:]))
+
+    names = ', '.join('r{}'.format(i) for i in range(registers))
+    source = ['def run(reg, pc, executed, limit):',
+              '    {}, = reg'.format(names),
+              '    start = executed',
+              '    while True:']
+    source += _indent(_dispatch(sorted(entries)), 8) if entries else ['        break']
+
+    if ip is not None:
+        # the bound register holds the last written instruction pointer
+        source += ['    if executed != start:', '        r{} = pc - 1'.format(ip)]
+    source += ['    reg[:] = {},'.format(names),
+               '    return pc, executed']
+
+    scope = {}
+    exec('\n'.join(source), scope)
+    scope['run'].source = '\n'.join(source)
+
+    return scope['run'], entries
+
+
+# operations where the operands a and b can be swapped
+COMMUTATIVE = {ADDR, MULR, BANR, BORR, EQRR}
+
+# idioms are patterns of instructions with symbolic registers (upper case), 'IP' is the bound register,
+# '@n' is a jump to the n-th instruction of the pattern and '_' is an operand that is not used
+
+# a += sum of all divisors of d, which is computed in O(d^2) with two nested loops
+#
+# f = 1
+# while f <= d:
+#     b = 1
+#     while b <= d:
+#         if f * b == d:
+#             a += f
+#         b += 1
+#     f += 1
+DIVISOR_SUM = [
+    (SETI, 1, '_', 'F'),
+    (SETI, 1, '_', 'B'),
+    (MULR, 'F', 'B', 'C'),
+    (EQRR, 'C', 'D', 'C'),
+    (ADDR, 'C', 'IP', 'IP'),
+    (ADDI, 'IP', 1, 'IP'),
+    (ADDR, 'F', 'A', 'A'),
+    (ADDI, 'B', 1, 'B'),
+    (GTRR, 'B', 'D', 'C'),
+    (ADDR, 'IP', 'C', 'IP'),
+    (SETI, '@2', '_', 'IP'),
+    (ADDI, 'F', 1, 'F'),
+    (GTRR, 'F', 'D', 'C'),
+    (ADDR, 'C', 'IP', 'IP'),
+    (SETI, '@1', '_', 'IP')
+]
+
+# q = e // k, which is computed by counting up until (q + 1) * k exceeds e
+#
+# q = 0
+# while True:
+#     t = (q + 1) * k
+#     if t > e:
+#         break
+#     q += 1
+DIVISION = [
+    (SETI, 0, '_', 'Q'),
+    (ADDI, 'Q', 1, 'T'),
+    (MULI, 'T', 'K', 'T'),
+    (GTRR, 'T', 'E', 'T'),
+    (ADDR, 'T', 'IP', 'IP'),
+    (ADDI, 'IP', 1, 'IP'),
+    (SETI, '@9', '_', 'IP'),
+    (ADDI, 'Q', 1, 'Q'),
+    (SETI, '@1', '_', 'IP')
+]
+
+
+def _divisor_sum(reg, r):
+    d = reg[r['D']]
+    if d >= 1:
+        total, f = 0, 1
+        while f * f <= d:
+            if d % f == 0:
+                total += f if f * f == d else f + d // f
+            f += 1
+        reg[r['A']] += total
+
+    # the loops leave the counters one past the limit (and run once if d is not positive)
+    reg[r['F']] = reg[r['B']] = max(d, 1) + 1
+    reg[r['C']] = 1
+    return True
+
+
+def _division(reg, r):
+    if r['K'] <= 0:
+        # the loop might not terminate, leave it to the program
+        return False
+
+    reg[r['Q']] = max(0, reg[r['E']] // r['K'])
+    reg[r['T']] = 1
+    return True
+
+
+# patterns and their closed form, which returns False if it can't be applied to the registers
+IDIOMS = [(DIVISOR_SUM, _divisor_sum), (DIVISION, _division)]
+
+
+def match(pattern, instructions, start, ip):
+    # returns the registers (and constants) per symbol if the instructions at start match the pattern, or None
+
+    def _bind(bindings, operands):
+        bindings = dict(bindings)
+        for symbol, value, is_register in operands:
+            if symbol == '_':
+                continue
+            elif isinstance(symbol, int):
+                if symbol != value:
+                    return None
+            elif symbol.startswith('@'):
+                # the instruction pointer is incremented after the jump
+                if value != start + int(symbol[1:]) - 1:
+                    return None
+            elif symbol in bindings:
+                if bindings[symbol] != (value, is_register):
+                    return None
+            elif is_register and (value, True) in bindings.values():
+                # symbols refer to distinct registers
+                return None
+            else:
+                bindings[symbol] = value, is_register
+
+        return bindings
+
+    def _unify(k, bindings):
+        if k == len(pattern):
+            return {symbol: value for symbol, (value, _) in bindings.items()}
+
+        op, a, b, c = pattern[k]
+        actual = instructions[start + k]
+        if actual[0] != op:
+            return None
+
+        reg_a, reg_b = OPERANDS[op]
+        for a_, b_ in [(a, b), (b, a)] if op in COMMUTATIVE else [(a, b)]:
+            result = _bind(bindings, [(a_, actual[1], reg_a), (b_, actual[2], reg_b), (c, actual[3], True)])
+            result = _unify(k + 1, result) if result is not None else None
+            if result is not None:
+                return result
+
+        return None
+
+    if ip is None or start + len(pattern) > len(instructions):
+        return None
+    return _unify(0, {'IP': (ip, True)})
+
+
+def idioms(instructions, ip):
+    # hooks that replace the recognized loops by their closed form, whatever registers and offsets they use
+    hooks = {}
+    for start in range(len(instructions)):
+        for pattern, closed_form in IDIOMS:
+            registers = match(pattern, instructions, start, ip)
+            if registers is not None:
+                hooks[start] = _idiom(closed_form, registers, start + len(pattern))
+
+    return hooks
+
+
+def _idiom(closed_form, registers, end):
+    def hook(machine):
+        # continue after the loop, or execute it as usual if the closed form doesn't apply
+        if closed_form(machine.reg, registers):
+            machine.pc = end
+
+    return hook
+
+
+class Machine:
+    """
+    Runs a list of (opcode, a, b, c) instructions, optionally with the instruction pointer bound to a register
+    """
+
+    def __init__(self, instructions, ip=None, registers=6, compiled=False, optimized=False, profiled=False):
+        self.instructions = instructions
+        self.ip = ip
+        self.reg = [0] * registers
+        self.pc = 0
+        self.executed = 0
+
+        # hooks are called with the machine, before the instruction at their index is executed,
+        # they may modify the registers or jump (by setting pc) and stop the machine by returning True
+        self.hooks = {}
+
+        # replace known loops by their closed form
+        if optimized:
+            self.hooks.update(idioms(instructions, ip))
+
+        # translate the program to python code, instead of interpreting one instruction at a time
+        self.compiled = compiled
+        self._code = None
+
+        # count the executions of each instruction and the jumps back from it (only while interpreting)
+        self.hits = [0] * len(instructions) if profiled else None
+        self.back_edges = [0] * len(instructions) if profiled else None
+
+    def compile(self):
+        # the hooks act as breakpoints in the compiled code, so it is recompiled if they change
+        breakpoints = frozenset(self.hooks.keys())
+        if self._code is None or self._code[0] != breakpoints:
+            code, entries = compile_program(self.instructions, self.ip, len(self.reg), breakpoints)
+            self._code = breakpoints, code, entries
+
+        return self._code[1:]
+
+    def run(self, budget=None):
+        # returns True if the program halted, False if it was stopped by a hook or ran out of budget
+        instructions, dispatch, hooks, reg, ip = self.instructions, DISPATCH, self.hooks, self.reg, self.ip
+        hits, back_edges = self.hits, self.back_edges
+        code, entries = self.compile() if self.compiled and hits is None else (None, ())
+        pc, executed = self.pc, self.executed
+        limit = sys.maxsize if budget is None else executed + budget
+
+        while 0 <= pc < len(instructions) and executed < limit:
+            if pc in hooks:
+                self.pc, self.executed = pc, executed
+                if hooks[pc](self):
+                    return False
+                if self.pc != pc:
+                    pc = self.pc
+                    continue
+
+            elif pc in entries:
+                # compiled code runs until it reaches a hook, an unknown jump target or the budget
+                before = executed
+                pc, executed = code(reg, pc, executed, limit)
+                if executed != before:
+                    continue
+
+            # interpret a single instruction
+            op, a, b, c = instructions[pc]
+            if hits is not None:
+                hits[pc] += 1
+                current = pc
+
+            if ip is None:
+                dispatch[op](reg, a, b, c)
+                pc += 1
+            else:
+                # the bound register holds the instruction pointer while executing
+                reg[ip] = pc
+                dispatch[op](reg, a, b, c)
+                pc = reg[ip] + 1
+
+            if hits is not None and pc <= current:
+                # jumps to the same or an earlier instruction close a loop
+                back_edges[current] += 1
+
+            executed += 1
+
+        self.pc, self.executed = pc, executed
+        return not (0 <= pc < len(instructions))
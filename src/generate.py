@@ -0,0 +1,202 @@
+# Advent of Code 2018, Input Generators
+# (c) blu3r4y
+
+import datetime
+import random
+import string
+
+# all generators emit lines (with trailing newlines, like readlines) or a single string in the puzzle format,
+# the first argument controls the size of the input and the seed makes them reproducible
+
+
+def frequencies(num_changes, limit=100, seed=0):
+    rng = random.Random(seed)
+    return ["{:+d}\n".format(rng.randint(-limit, limit) or 1) for _ in range(num_changes)]
+
+
+def boxes(num_boxes, length=26, seed=0):
+    rng = random.Random(seed)
+    ids = [''.join(rng.choice(string.ascii_lowercase) for _ in range(length)) for _ in range(num_boxes)]
+
+    # plant exactly one pair that differs by a single character, at the very end
+    twin = list(ids[-1])
+    twin[rng.randrange(length)] = 'A'
+    ids.append(''.join(twin))
+
+    return [box + "\n" for box in ids]
+
+
+def claims(num_claims, fabric=1000, max_size=30, seed=0):
+    rng = random.Random(seed)
+    result = []
+    for i in range(1, num_claims + 1):
+        w, h = rng.randint(1, max_size), rng.randint(1, max_size)
+        x, y = rng.randint(0, fabric - w), rng.randint(0, fabric - h)
+        result.append("#{} @ {},{}: {}x{}\n".format(i, x, y, w, h))
+
+    return result
+
+
+def guard_logs(num_shifts, num_guards=20, max_naps=3, seed=0):
+    rng = random.Random(seed)
+    guards = rng.sample(range(1, 10 * num_guards), num_guards)
+    midnight = datetime.datetime(1518, 1, 1)
+
+    result = []
+    for _ in range(num_shifts):
+        # shifts begin shortly before or after midnight
+        begin = midnight + datetime.timedelta(minutes=rng.randint(-10, 5))
+        result.append((begin, "Guard #{} begins shift".format(rng.choice(guards))))
+
+        # naps happen between 00:00 and 00:59, starting after the shift began
+        first = begin.minute + 1 if begin >= midnight else 0
+        minutes = sorted(rng.sample(range(first, 60), 2 * rng.randint(0, max_naps)))
+        for asleep, wakeup in zip(minutes[::2], minutes[1::2]):
+            result.append((midnight + datetime.timedelta(minutes=asleep), "falls asleep"))
+            result.append((midnight + datetime.timedelta(minutes=wakeup), "wakes up"))
+
+        midnight += datetime.timedelta(days=1)
+
+    # records are unordered in the puzzle input
+    rng.shuffle(result)
+    return ["[{:%Y-%m-%d %H:%M}] {}\n".format(time, event) for time, event in result]
+
+
+def polymer(length, seed=0):
+    rng = random.Random(seed)
+    return ''.join(rng.choice(string.ascii_letters) for _ in range(length))
+
+
+def coordinates(num_sites, extent=400, seed=0):
+    rng = random.Random(seed)
+    return ["{}, {}\n".format(rng.randint(0, extent), rng.randint(0, extent)) for _ in range(num_sites)]
+
+
+def steps(num_steps, num_edges=None, seed=0):
+    rng = random.Random(seed)
+
+    # steps are single characters, beyond 'Z' they continue with the following code points
+    names = [chr(ord('A') + i) for i in range(num_steps)]
+    order = rng.sample(names, num_steps)
+
+    # edges only point forward in a random order, which keeps the graph acyclic
+    edges = set()
+    for _ in range(num_edges or 2 * num_steps):
+        i, j = sorted(rng.sample(range(num_steps), 2))
+        edges.add((order[i], order[j]))
+
+    return ["Step {} must be finished before step {} can begin.\n".format(a, b) for a, b in sorted(edges)]
+
+
+def maze(size, density=0.15, seed=0):
+    rng = random.Random(seed)
+
+    # walls on the border and some scattered inside
+    grid = [['#' if x in (0, size - 1) or y in (0, size - 1) or rng.random() < density else '.'
+             for y in range(size)] for x in range(size)]
+
+    # place goblins and elves on free cells
+    free = [(x, y) for x in range(size) for y in range(size) if grid[x][y] == '.']
+    for i, (x, y) in enumerate(rng.sample(free, 2 * (size // 4 + 1))):
+        grid[x][y] = 'G' if i % 2 == 0 else 'E'
+
+    return [''.join(row) + "\n" for row in grid]
+
+
+def clay_veins(num_bowls, width=200, depth=1000, max_size=30, seed=0):
+    rng = random.Random(seed)
+    result = []
+    for _ in range(num_bowls):
+        # a bowl is made of two vertical walls and a horizontal bottom
+        w, h = rng.randint(2, max_size), rng.randint(1, max_size)
+        x = rng.randint(500 - width // 2, 500 + width // 2 - w)
+        y = rng.randint(1, depth - h)
+        result.append("x={}, y={}..{}\n".format(x, y, y + h))
+        result.append("x={}, y={}..{}\n".format(x + w, y, y + h))
+        result.append("y={}, x={}..{}\n".format(y + h, x, x + w))
+
+    rng.shuffle(result)
+    return result
+
+
+def route_regex(length, max_depth=5, seed=0):
+    rng = random.Random(seed)
+    back = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
+
+    def _detour():
+        # a path that leads back to where it started, e.g. (NEWS|)
+        path = [rng.choice("NSEW") for _ in range(rng.randint(1, 4))]
+        return "(" + ''.join(path + [back[di] for di in reversed(path)]) + "|)"
+
+    def _expression(budget, depth):
+        result = ""
+        while budget > 0:
+            if depth < max_depth and budget > 20 and rng.random() < 0.02:
+                # the route forks and never joins again, like in the puzzle input, which ends the expression
+                options = [_expression(budget // 3, depth + 1) for _ in range(rng.randint(2, 3))]
+                return result + "(" + "|".join(options) + ")"
+            elif rng.random() < 0.05:
+                result += _detour()
+                budget -= 10
+            else:
+                result += rng.choice("NSEW")
+                budget -= 1
+
+        return result or rng.choice("NSEW")
+
+    return "^" + _expression(length, 0) + "$"
+
+
+def nanobots(num_bots, extent=10 ** 8, seed=0):
+    rng = random.Random(seed)
+    return ["pos=<{},{},{}>, r={}\n".format(rng.randint(-extent, extent), rng.randint(-extent, extent),
+                                           rng.randint(-extent, extent), rng.randint(extent // 20, extent // 2))
+            for _ in range(num_bots)]
+
+
+def army_groups(num_groups, seed=0):
+    rng = random.Random(seed)
+    elements = ["fire", "cold", "slashing", "bludgeoning", "radiation"]
+
+    # initiatives are unique among all groups
+    initiatives = rng.sample(range(1, 2 * num_groups + 1), 2 * num_groups)
+
+    def _group(iv):
+        immune, weak = [], []
+        for element in rng.sample(elements, rng.randint(0, 3)):
+            (immune if rng.random() < 0.5 else weak).append(element)
+
+        props = []
+        if immune:
+            props.append("immune to " + ", ".join(immune))
+        if weak:
+            props.append("weak to " + ", ".join(weak))
+        props = " ({}) ".format("; ".join(props)) if props else " "
+
+        return "{} units each with {} hit points{}with an attack that does {} {} damage at initiative {}\n".format(
+            rng.randint(10, 5000), rng.randint(100, 10000), props, rng.randint(5, 100), rng.choice(elements), iv)
+
+    return ["Immune System:\n"] + [_group(iv) for iv in initiatives[:num_groups]] + \
+           ["\n", "Infection:\n"] + [_group(iv) for iv in initiatives[num_groups:]]
+
+
+def points(num_points, extent=8, seed=0):
+    rng = random.Random(seed)
+    return [",".join(str(rng.randint(-extent, extent)) for _ in range(4)) + "\n" for _ in range(num_points)]
+
+
+GENERATORS = {
+    1: frequencies,
+    2: boxes,
+    3: claims,
+    4: guard_logs,
+    5: polymer,
+    6: coordinates,
+    7: steps,
+    15: maze,
+    17: clay_veins,
+    20: route_regex,
+    23: nanobots,
+    24: army_groups,
+    25: points,
+}
@@ -0,0 +1,111 @@
+# Advent of Code 2018, Instrumentation
+# (c) blu3r4y
+
+import functools
+import os
+import time
+
+# instrumentation is opt-in, by setting AOC_INSTRUMENT before the solvers are imported, otherwise the
+# decorator returns the function itself and spans and items are no-ops, so that it costs next to nothing
+ENABLED = bool(os.environ.get("AOC_INSTRUMENT"))
+
+# statistics per stack of span names, joined by ';'
+STATS = {}
+
+# open spans, as [name, start time, time spent in child spans]
+_stack = []
+
+
+class _Span:
+    """
+    Context manager that records the call count and timing of a code region, nested in the open spans
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _stack.append([self.name, time.perf_counter(), 0.0])
+        return self
+
+    def __exit__(self, *exc):
+        key = ';'.join(frame[0] for frame in _stack)
+        name, start, children = _stack.pop()
+        elapsed = time.perf_counter() - start
+        if _stack:
+            _stack[-1][2] += elapsed
+
+        stats = STATS.setdefault(key, {"calls": 0, "seconds": 0.0, "self": 0.0, "items": {}})
+        stats["calls"] += 1
+        stats["seconds"] += elapsed
+        stats["self"] += elapsed - children
+        return False
+
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    # with span("name"): ... records the enclosed code as a child of the open spans
+    return _Span(name) if ENABLED else _NO_SPAN
+
+
+def timed(fn):
+    # decorator that records every call of the function as a span named by its qualified name
+    if not ENABLED:
+        return fn
+
+    name = fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _Span(name):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def items(n):
+    # number of items the innermost span processed (e.g. nodes expanded), collected as a histogram
+    # with power of two buckets, since the instrumented functions are called millions of times
+    if not ENABLED or not _stack:
+        return
+
+    key = ';'.join(frame[0] for frame in _stack)
+    histogram = STATS.setdefault(key, {"calls": 0, "seconds": 0.0, "self": 0.0, "items": {}})["items"]
+    bucket = str(1 << max(0, int(n) - 1).bit_length())
+    histogram[bucket] = histogram.get(bucket, 0) + 1
+
+
+def collect():
+    # returns and resets the statistics of this process
+    stats = dict(STATS)
+    STATS.clear()
+    return stats
+
+
+def merge(reports):
+    # sums up the statistics of several processes
+    merged = {}
+    for report in reports:
+        for key, stats in report.items():
+            target = merged.setdefault(key, {"calls": 0, "seconds": 0.0, "self": 0.0, "items": {}})
+            for field in ("calls", "seconds", "self"):
+                target[field] += stats[field]
+            for bucket, count in stats["items"].items():
+                target["items"][bucket] = target["items"].get(bucket, 0) + count
+
+    return merged
+
+
+def collapsed(stats):
+    # flamegraph compatible lines "outer;inner <self time in microseconds>"
+    return ["{} {}".format(key, int(round(s["self"] * 1e6))) for key, s in sorted(stats.items())]